@@ -166,6 +166,13 @@ class LexicalAnalyzer:
         else:
             print("No lexical errors found.")
 
+def tokenize(code):
+    """Analyze 'code' in-process and return the token list (comment tokens
+    are never emitted by analyze). Entry point for callers that want the
+    tokens directly instead of parsing the printed table."""
+    tokens, _errors = LexicalAnalyzer().analyze(code)
+    return tokens
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python lexical_analyzer.py <file>", file=sys.stderr)
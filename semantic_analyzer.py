@@ -3,16 +3,94 @@
 
 import sys
 import json
-from prettytable import PrettyTable
+from collections import defaultdict
+from operator import add, sub, mul, pow, eq, ne, lt, gt, le, ge
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tipos semánticos internados: los visitantes devuelven siempre estas
+# constantes, de modo que las comparaciones pueden hacerse por identidad
+# ('is') en lugar de comparar carácter a carácter.
+INT = sys.intern('int')
+FLOAT = sys.intern('float')
+BOOL = sys.intern('bool')
+STRING = sys.intern('string')
+ERROR = sys.intern('error')
+
+_NUMERIC = (INT, FLOAT)
+
+# Conjuntos de tipos construidos una sola vez: la pertenencia cuesta un
+# hash en lugar de reconstruir una lista y recorrerla en cada chequeo.
+_PRINTABLE = frozenset((INT, FLOAT, BOOL, STRING, ERROR))
+_BOOL_OR_ERR = frozenset((BOOL, ERROR))
+
+# Centinela compartido para nodos sin hijos: iterar una tupla vacía es
+# idéntico a iterar una lista y no cuesta una asignación por nodo.
+_EMPTY: Tuple = ()
+
+# Operadores aritméticos sin casos especiales: un despacho por hash en
+# lugar de la escalera de comparaciones sobre 'op'. '/' y '%' se tratan
+# aparte porque necesitan chequeo de división por cero.
+_SIMPLE_OPS = {'+': add, '-': sub, '*': mul, '^': pow}
+
+# Operadores relacionales: mismo despacho por hash que _SIMPLE_OPS, en
+# lugar de la cadena de comparaciones sobre 'op'.
+_REL_OPS = {'==': eq, '!=': ne, '<': lt, '>': gt, '<=': le, '>=': ge}
+
+# Nodos puramente estructurales: sólo recorren a sus hijos, así que el
+# despachador los atiende en línea sin pagar una llamada de método.
+_STRUCTURAL = frozenset(('programa', 'lista_declaracion'))
+
+# Nodos de expresión cuyo valor constante permite reescribirlos como
+# literales durante el plegado de constantes.
+_FOLDABLE = frozenset(('expresion_simple', 'termino', 'factor',
+                       'expresion_relacional', 'expresion_logica'))
+
+class Symbol:
+    """Entrada ligera de la tabla de símbolos (acceso por slots, no por hash)."""
+    __slots__ = ('type', 'line', 'column', 'is_initialized', 'const_value')
+
+    def __init__(self, type: str, line: int, column: int):
+        self.type = type
+        self.line = line
+        self.column = column
+        self.is_initialized = False
+        self.const_value = None
+
+class XRef:
+    """Entrada de la tabla de referencias cruzadas."""
+    __slots__ = ('type', 'lines', 'address')
+
+    def __init__(self, type: str, line: int, address: int):
+        self.type = type
+        # Un set deduplica las referencias repetidas en la misma línea;
+        # se convierte a lista ordenada sólo al volcar el JSON.
+        self.lines = {line}
+        self.address = address
+
 class SemanticError:
-    """Clase para almacenar información sobre errores semánticos."""
-    def __init__(self, description: str, line: int, column: int):
-        self.description = description
-        self.line = line if line is not None else 0
-        self.column = column if column is not None else 0
-    
+    """Clase para almacenar información sobre errores semánticos.
+
+    El mensaje se guarda como plantilla + argumentos y sólo se formatea
+    al mostrarlo, de modo que registrar un error no construye cadenas.
+    """
+    __slots__ = ('template', 'args', 'line', 'column')
+
+    def __init__(self, template: str, args: Tuple, line: int, column: int):
+        # add_error ya garantiza line/column no nulos ('or 0').
+        self.template = template
+        self.args = args
+        self.line = line
+        self.column = column
+
+    @property
+    def description(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+
     def __str__(self):
         return f"Error: {self.description} (Línea {self.line}, Columna {self.column})"
 
@@ -23,33 +101,57 @@ class SemanticAnalyzer:
     """
     def __init__(self):
         # Tabla para chequeo rápido de tipo y declaración
-        self.symbol_table: Dict[str, Dict[str, Any]] = {} 
+        self.symbol_table: Dict[str, Symbol] = {}
         self.errors: List[SemanticError] = []
         self.ast: Optional[Dict[str, Any]] = None
         
         # Tabla de Referencias Cruzadas (para mostrar en el IDE)
-        self.cross_reference_table: Dict[str, Dict[str, Any]] = {}
+        self.cross_reference_table: Dict[str, XRef] = {}
         self.current_address = 1 # Para la columna "Dirección"
 
+        # Usos de identificadores pendientes de volcar a la tabla de
+        # referencias cruzadas; se integran de una sola vez al reportar.
+        self._pending_refs: Dict[str, List[int]] = defaultdict(list)
+
+        # Tabla de despacho precalculada: evita construir "visit_<tipo>" y
+        # llamar a getattr() en cada nodo del AST.
+        self._dispatch = {
+            name[len('visit_'):]: getattr(self, name)
+            for name in dir(self) if name.startswith('visit_')
+        }
+
     def load_ast(self, ast_file_path: str):
         """Carga el AST desde el archivo JSON generado por el analizador sintáctico."""
         try:
             with open(ast_file_path, 'r', encoding='utf-8') as f:
                 self.ast = json.load(f)
+            self._normalize(self.ast)
             return True
         except FileNotFoundError:
-            self.add_error(f"No se encontró el archivo AST: {ast_file_path}", 0, 0)
+            self.add_error("No se encontró el archivo AST: {}", 0, 0, ast_file_path)
             return False
         except json.JSONDecodeError:
-            self.add_error(f"Error al decodificar el archivo AST: {ast_file_path}", 0, 0)
+            self.add_error("Error al decodificar el archivo AST: {}", 0, 0, ast_file_path)
             return False
         except Exception as e:
-            self.add_error(f"Error al cargar el AST: {str(e)}", 0, 0)
+            self.add_error("Error al cargar el AST: {}", 0, 0, str(e))
             return False
 
-    def add_error(self, message: str, line: Optional[int], column: Optional[int]):
-        """Añade un error semántico a la lista."""
-        self.errors.append(SemanticError(message, line or 0, column or 0))
+    def _normalize(self, root: Dict[str, Any]):
+        """Garantiza 'children'/'line'/'column' en cada nodo, en una sola
+        pasada iterativa, para que los visitantes puedan indexar directo."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node.setdefault('children', _EMPTY)
+            node.setdefault('line', 0)
+            node.setdefault('column', 0)
+            stack.extend(node['children'])
+
+    def add_error(self, template: str, line: Optional[int], column: Optional[int], *args):
+        """Añade un error semántico a la lista. 'template' es una plantilla
+        de str.format con los huecos en 'args'; se formatea sólo al reportar."""
+        self.errors.append(SemanticError(template, args, line or 0, column or 0))
 
     def analyze(self):
         """Punto de entrada principal para iniciar el análisis semántico."""
@@ -58,8 +160,149 @@ class SemanticAnalyzer:
         
         try:
             self.visit(self.ast)
+            self._fold(self.ast)
         except Exception as e:
-            self.add_error(f"Error inesperado durante el análisis: {str(e)}", 0, 0)
+            self.add_error("Error inesperado durante el análisis: {}", 0, 0, str(e))
+
+    @staticmethod
+    def _literal(node: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """Devuelve (tipo, valor) si el nodo es un literal 'numero'/'bool',
+        o None en caso contrario."""
+        node_type = node.get('node_type')
+        if node_type == 'numero':
+            value_str = node.get('value', '')
+            try:
+                if '.' in value_str:
+                    return FLOAT, float(value_str)
+                return INT, int(value_str)
+            except ValueError:
+                return None
+        if node_type == 'bool':
+            return BOOL, node.get('value') == 'true'
+        return None
+
+    def _fold_literals(self, node: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """Evalúa un nodo de expresión cuyos operandos son todos literales.
+        Devuelve (tipo, valor) o None si no se puede plegar. No reporta
+        errores: la visita ya diagnosticó este subárbol."""
+        op = node.get('value')
+        node_type = node['node_type']
+        children = node['children']
+
+        if node_type == 'expresion_logica' and op == '!':
+            lit = self._literal(children[0]) if len(children) == 1 else None
+            if lit is None or lit[0] is not BOOL:
+                return None
+            return BOOL, not lit[1]
+
+        if len(children) != 2:
+            return None
+        left = self._literal(children[0])
+        right = self._literal(children[1])
+        if left is None or right is None:
+            return None
+        left_type, left_val = left
+        right_type, right_val = right
+
+        if node_type == 'expresion_logica':
+            if left_type is not BOOL or right_type is not BOOL:
+                return None
+            if op == '&&':
+                return BOOL, left_val and right_val
+            if op == '||':
+                return BOOL, left_val or right_val
+            return None
+
+        if node_type == 'expresion_relacional':
+            fn = _REL_OPS.get(op)
+            numeric = left_type in _NUMERIC and right_type in _NUMERIC
+            if fn is None or not (numeric or (left_type is BOOL and right_type is BOOL)):
+                return None
+            return BOOL, fn(left_val, right_val)
+
+        # Aritmética (expresion_simple / termino / factor).
+        if left_type not in _NUMERIC or right_type not in _NUMERIC:
+            return None
+        result_type = FLOAT if left_type is FLOAT or right_type is FLOAT else INT
+        l = float(left_val) if result_type is FLOAT else left_val
+        r = float(right_val) if result_type is FLOAT else right_val
+        # Misma guarda que _calculate_arithmetic: un desborde sobre
+        # literales (p. ej. un '^' flotante enorme) deja la expresión sin
+        # plegar en vez de abortar la pasada entera.
+        try:
+            fn = _SIMPLE_OPS.get(op)
+            if fn is not None:
+                return result_type, fn(l, r)
+            if op == '/' and r != 0:
+                return result_type, l / r if result_type is FLOAT else l // r
+            if op == '%' and result_type is INT and r != 0:
+                return INT, l % r
+        except (OverflowError, ValueError):
+            return None
+        return None
+
+    def _fold(self, node: Dict[str, Any], folding: bool = True):
+        """Plegado de constantes sobre el AST ya anotado (de abajo hacia
+        arriba): las expresiones cuyos operandos quedaron reducidos a
+        literales 'numero'/'bool' se reescriben como literales, y los
+        if/while con condición literal pierden la rama muerta. El valor
+        se recalcula desde los propios literales — los 'semantic_value'
+        anotados provienen de un seguimiento insensible al flujo y sólo
+        valen como anotación para el IDE. Los subárboles de bucles no se
+        tocan: sus sentencias y condiciones se reevalúan en cada vuelta
+        con valores que cambian dentro del propio bucle. Los errores ya
+        fueron recolectados durante la visita, así que los diagnósticos
+        no cambian."""
+        node_type = node.get('node_type')
+        child_folding = folding and node_type != 'iteracion' and node_type != 'repeticion'
+        for child in node['children']:
+            self._fold(child, child_folding)
+
+        if not folding:
+            return
+
+        if node_type in _FOLDABLE:
+            if node.get('semantic_type') is not ERROR:
+                folded = self._fold_literals(node)
+                if folded is not None:
+                    folded_type, value = folded
+                    if folded_type is BOOL:
+                        node['node_type'] = 'bool'
+                        node['value'] = 'true' if value else 'false'
+                        node['children'] = _EMPTY
+                    elif value >= 0:
+                        # Un literal negativo no es representable: el
+                        # ejecutor parte cada instrucción por su operador
+                        # y leería '-4' como una resta sin operando.
+                        node['node_type'] = 'numero'
+                        node['value'] = str(value)
+                        node['children'] = _EMPTY
+
+        elif node_type == 'seleccion':
+            children = node['children']
+            if len(children) > 1 and children[1].get('node_type') == 'bool':
+                wanted = 'then_block' if children[1]['value'] == 'true' else 'else_block'
+                chosen = None
+                for child in children:
+                    if child.get('node_type') == wanted:
+                        chosen = child
+                        break
+                node['node_type'] = 'lista_sentencias'
+                node['value'] = None
+                node['children'] = chosen['children'] if chosen else _EMPTY
+
+        elif node_type == 'iteracion':
+            for child in node['children']:
+                if child.get('node_type') == 'condicion' and child['children']:
+                    cond = child['children'][0]
+                    # Sólo un 'while false' escrito como literal es
+                    # eliminable; 'while true' debe conservarse (bucle
+                    # deliberadamente infinito).
+                    if cond.get('node_type') == 'bool' and cond.get('value') == 'false':
+                        node['node_type'] = 'lista_sentencias'
+                        node['value'] = None
+                        node['children'] = _EMPTY
+                    break
 
     def visit(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """
@@ -69,10 +312,17 @@ class SemanticAnalyzer:
         node_type = node.get('node_type')
         if not node_type:
             return 'unknown', None
-            
-        method_name = f"visit_{node_type}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        
+
+        if node_type in _STRUCTURAL:
+            visit = self.visit
+            for child in node['children']:
+                visit(child)
+            node['semantic_type'] = 'void'
+            node['semantic_value'] = None
+            return 'void', None
+
+        visitor = self._dispatch.get(node_type, self.generic_visit)
+
         semantic_type, semantic_value = visitor(node)
         
         node['semantic_type'] = semantic_type
@@ -82,47 +332,30 @@ class SemanticAnalyzer:
 
     def generic_visit(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Visitante genérico para nodos estructurales (recorre hijos)."""
-        for child in node.get('children', []):
+        for child in node['children']:
             self.visit(child)
         return 'structural', None
 
     # --- Visitantes de Declaración y Estructura ---
 
-    def visit_programa(self, node: Dict[str, Any]) -> Tuple[str, Any]:
-        for child in node.get('children', []):
-            self.visit(child)
-        return 'void', None
-
-    def visit_lista_declaracion(self, node: Dict[str, Any]) -> Tuple[str, Any]:
-        for child in node.get('children', []):
-            self.visit(child)
-        return 'void', None
-
     def visit_declaracion_variable(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Procesa la declaración y la añade a ambas tablas."""
         var_type = node.get('value')
-        
-        for id_node in node.get('children', []):
+        if var_type:
+            var_type = sys.intern(var_type)
+        st = self.symbol_table
+        xref = self.cross_reference_table
+
+        for id_node in node['children']:
             var_name = id_node.get('value')
-            line = id_node.get('line')
-            column = id_node.get('column')
-            
-            if var_name in self.symbol_table:
-                self.add_error(f"Identificador duplicado '{var_name}'", line, column)
+            line = id_node['line']
+            column = id_node['column']
+
+            if var_name in st:
+                self.add_error("Identificador duplicado '{}'", line, column, var_name)
             else:
-                self.symbol_table[var_name] = {
-                    'type': var_type,
-                    'line': line,
-                    'column': column,
-                    'is_initialized': False, 
-                    'const_value': None
-                }
-                
-                self.cross_reference_table[var_name] = {
-                    'type': var_type,
-                    'lines': [line],
-                    'address': self.current_address
-                }
+                st[var_name] = Symbol(var_type, line, column)
+                xref[var_name] = XRef(var_type, line, self.current_address)
                 self.current_address += 1
             
             id_node['semantic_type'] = var_type
@@ -137,17 +370,17 @@ class SemanticAnalyzer:
         rhs_node = node['children'][1]
         
         var_name = id_node.get('value')
-        line = node.get('line')
-        column = node.get('column')
-        
-        if var_name in self.cross_reference_table:
-            self.cross_reference_table[var_name]['lines'].append(line)
-        
-        if var_name not in self.symbol_table:
-            self.add_error(f"Variable no declarada '{var_name}' en asignación", line, column)
-            lhs_type = 'error'
+        line = node['line']
+        column = node['column']
+
+        self._pending_refs[var_name].append(line)
+
+        entry = self.symbol_table.get(var_name)
+        if entry is None:
+            self.add_error("Variable no declarada '{}' en asignación", line, column, var_name)
+            lhs_type = ERROR
         else:
-            lhs_type = self.symbol_table[var_name]['type']
+            lhs_type = entry.type
         
         id_node['semantic_type'] = lhs_type
         
@@ -156,19 +389,19 @@ class SemanticAnalyzer:
         # --- MODIFICACIÓN 1: Marcar el nodo 'asignacion' como error ---
         node_type = 'void' # Asumir éxito
         
-        if lhs_type != 'error' and rhs_type != 'error':
+        if lhs_type is not ERROR and rhs_type is not ERROR:
             if lhs_type == rhs_type:
-                pass 
-            elif lhs_type == 'float' and rhs_type == 'int':
+                pass
+            elif lhs_type is FLOAT and rhs_type is INT:
                 pass # Promoción válida
             else:
-                self.add_error(f"Incompatibilidad de tipos: No se puede asignar '{rhs_type}' a '{lhs_type}'",
-                               line, column)
+                self.add_error("Incompatibilidad de tipos: No se puede asignar '{}' a '{}'",
+                               line, column, rhs_type, lhs_type)
                 node_type = 'error' # ¡Marcar el nodo como erróneo!
         
-        if lhs_type != 'error':
-            self.symbol_table[var_name]['is_initialized'] = True
-            self.symbol_table[var_name]['const_value'] = rhs_value
+        if lhs_type is not ERROR:
+            entry.is_initialized = True
+            entry.const_value = rhs_value
                                
         return node_type, rhs_value # Devolver el tipo del nodo ('void' o 'error')
         # --- FIN DE MODIFICACIÓN 1 ---
@@ -182,9 +415,9 @@ class SemanticAnalyzer:
         # --- MODIFICACIÓN 2: Marcar el nodo 'seleccion' como error ---
         node_type = 'void' # Asumir éxito
         
-        if cond_type not in ['bool', 'error']:
-            self.add_error(f"La condición 'if' debe ser 'bool', pero se encontró '{cond_type}'",
-                           cond_node.get('line'), cond_node.get('column'))
+        if cond_type not in _BOOL_OR_ERR:
+            self.add_error("La condición 'if' debe ser 'bool', pero se encontró '{}'",
+                           cond_node['line'], cond_node['column'], cond_type)
             node_type = 'error' # ¡Marcar el nodo como erróneo!
         
         self.visit(node['children'][3]) # then_block
@@ -203,9 +436,9 @@ class SemanticAnalyzer:
         # --- MODIFICACIÓN 3: Marcar el nodo 'iteracion' como error ---
         node_type = 'void'
         
-        if cond_type not in ['bool', 'error']:
-            self.add_error(f"La condición 'while' debe ser 'bool', pero se encontró '{cond_type}'",
-                           cond_node.get('line'), cond_node.get('column'))
+        if cond_type not in _BOOL_OR_ERR:
+            self.add_error("La condición 'while' debe ser 'bool', pero se encontró '{}'",
+                           cond_node['line'], cond_node['column'], cond_type)
             node_type = 'error'
 
         self.visit(node['children'][2]) # cuerpo
@@ -222,9 +455,9 @@ class SemanticAnalyzer:
         # --- MODIFICACIÓN 4: Marcar el nodo 'repeticion' como error ---
         node_type = 'void'
         
-        if cond_type not in ['bool', 'error']:
-            self.add_error(f"La condición 'until' debe ser 'bool', pero se encontró '{cond_type}'",
-                           cond_node.get('line'), cond_node.get('column'))
+        if cond_type not in _BOOL_OR_ERR:
+            self.add_error("La condición 'until' debe ser 'bool', pero se encontró '{}'",
+                           cond_node['line'], cond_node['column'], cond_type)
             node_type = 'error'
 
         return node_type, None
@@ -232,35 +465,38 @@ class SemanticAnalyzer:
 
     def visit_sent_in(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Verifica 'cin' y actualiza el estado de la variable."""
-        for child in node.get('children', []):
-            if child.get('node_type') == 'id':
-                var_name = child.get('value')
-                line = child.get('line')
-                
-                if var_name in self.cross_reference_table:
-                    self.cross_reference_table[var_name]['lines'].append(line)
+        st = self.symbol_table
+        for child in node['children']:
+            if child.get('node_type') != 'id':
+                continue
+            var_name = child.get('value')
+            line = child['line']
+
+            self._pending_refs[var_name].append(line)
+
+            entry = st.get(var_name)
+            if entry is None:
+                self.add_error("Variable no declarada '{}' en 'cin'",
+                               line, child['column'], var_name)
+                child['semantic_type'] = ERROR
+            else:
+                child['semantic_type'] = entry.type
+                entry.is_initialized = True
+                entry.const_value = None
 
-                if var_name not in self.symbol_table:
-                    self.add_error(f"Variable no declarada '{var_name}' en 'cin'",
-                                   child.get('line'), child.get('column'))
-                    child['semantic_type'] = 'error'
-                else:
-                    child['semantic_type'] = self.symbol_table[var_name]['type']
-                    self.symbol_table[var_name]['is_initialized'] = True
-                    self.symbol_table[var_name]['const_value'] = None
-                    
         return 'void', None
 
     def visit_sent_out(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Verifica 'cout' (visita expresiones hijas)."""
         node_type = 'void'
-        for child in node.get('children', []):
-            if child.get('node_type') not in ['cout', '<<']:
-                expr_type, expr_value = self.visit(child)
-                if expr_type not in ['int', 'float', 'bool', 'string', 'error']:
-                    self.add_error(f"Tipo no imprimible '{expr_type}' en 'cout'",
-                                   child.get('line'), child.get('column'))
-                    node_type = 'error' # Marcar 'sent_out' como erróneo
+        for child in node['children']:
+            if child.get('node_type') in ('cout', '<<'):
+                continue
+            expr_type, expr_value = self.visit(child)
+            if expr_type not in _PRINTABLE:
+                self.add_error("Tipo no imprimible '{}' en 'cout'",
+                               child['line'], child['column'], expr_type)
+                node_type = 'error' # Marcar 'sent_out' como erróneo
         return node_type, None
 
     # --- Visitantes de Expresiones ---
@@ -271,36 +507,34 @@ class SemanticAnalyzer:
             return None
         
         try:
-            l = float(left_val) if result_type == 'float' else left_val
-            r = float(right_val) if result_type == 'float' else right_val
+            l = float(left_val) if result_type is FLOAT else left_val
+            r = float(right_val) if result_type is FLOAT else right_val
+
+            fn = _SIMPLE_OPS.get(op)
+            if fn is not None:
+                return fn(l, r)
 
-            if op == '+': return l + r
-            if op == '-': return l - r
-            if op == '*': return l * r
-            
             if op == '/':
                 if r == 0:
-                    self.add_error(f"División por cero en tiempo de compilación", node.get('line'), node.get('column'))
+                    self.add_error("División por cero en tiempo de compilación", node['line'], node['column'])
                     return None
-                
-                if result_type == 'float':
+
+                if result_type is FLOAT:
                     return l / r
                 else:
                     return l // r # División entera
-            
-            if op == '^': return l ** r
-            
+
             if op == '%':
-                if result_type == 'float':
-                    self.add_error(f"Operador '%' no se puede aplicar a 'float'", node.get('line'), node.get('column'))
+                if result_type is FLOAT:
+                    self.add_error("Operador '%' no se puede aplicar a 'float'", node['line'], node['column'])
                     return None
                 if r == 0:
-                    self.add_error(f"División por cero (módulo) en tiempo de compilación", node.get('line'), node.get('column'))
+                    self.add_error("División por cero (módulo) en tiempo de compilación", node['line'], node['column'])
                     return None
                 return l % r
-                
+
         except Exception as e:
-            self.add_error(f"Error en operación aritmética: {e}", node.get('line'), node.get('column'))
+            self.add_error("Error en operación aritmética: {}", node['line'], node['column'], e)
             return None
         return None
 
@@ -310,15 +544,15 @@ class SemanticAnalyzer:
         left_type, left_val = self.visit(node['children'][0])
         right_type, right_val = self.visit(node['children'][1])
 
-        if left_type == 'error' or right_type == 'error':
-            return 'error', None
+        if left_type is ERROR or right_type is ERROR:
+            return ERROR, None
 
-        if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
-            self.add_error(f"Operador aritmético '{op}' no se puede aplicar a '{left_type}' y '{right_type}'",
-                           node.get('line'), node.get('column'))
-            return 'error', None
+        if left_type not in _NUMERIC or right_type not in _NUMERIC:
+            self.add_error("Operador aritmético '{}' no se puede aplicar a '{}' y '{}'",
+                           node['line'], node['column'], op, left_type, right_type)
+            return ERROR, None
 
-        result_type = 'float' if left_type == 'float' or right_type == 'float' else 'int'
+        result_type = FLOAT if left_type is FLOAT or right_type is FLOAT else INT
         result_val = self._calculate_arithmetic(op, left_val, right_val, result_type, node)
         
         return result_type, result_val
@@ -329,21 +563,21 @@ class SemanticAnalyzer:
         left_type, left_val = self.visit(node['children'][0])
         right_type, right_val = self.visit(node['children'][1])
 
-        if left_type == 'error' or right_type == 'error':
-            return 'error', None
+        if left_type is ERROR or right_type is ERROR:
+            return ERROR, None
 
-        if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
-            self.add_error(f"Operador aritmético '{op}' no se puede aplicar a '{left_type}' y '{right_type}'",
-                           node.get('line'), node.get('column'))
-            return 'error', None
+        if left_type not in _NUMERIC or right_type not in _NUMERIC:
+            self.add_error("Operador aritmético '{}' no se puede aplicar a '{}' y '{}'",
+                           node['line'], node['column'], op, left_type, right_type)
+            return ERROR, None
 
-        result_type = 'float' if left_type == 'float' or right_type == 'float' else 'int'
+        result_type = FLOAT if left_type is FLOAT or right_type is FLOAT else INT
         
         result_val = self._calculate_arithmetic(op, left_val, right_val, result_type, node)
         
-        if op == '%' and result_type == 'float':
-            self.add_error(f"Operador '%' no se puede aplicar a 'float'", node.get('line'), node.get('column'))
-            return 'error', None # <-- Ya estaba, pero es correcto
+        if op == '%' and result_type is FLOAT:
+            self.add_error("Operador '%' no se puede aplicar a 'float'", node['line'], node['column'])
+            return ERROR, None # <-- Ya estaba, pero es correcto
         
         return result_type, result_val
 
@@ -353,15 +587,15 @@ class SemanticAnalyzer:
         left_type, left_val = self.visit(node['children'][0])
         right_type, right_val = self.visit(node['children'][1])
 
-        if left_type == 'error' or right_type == 'error':
-            return 'error', None
+        if left_type is ERROR or right_type is ERROR:
+            return ERROR, None
 
-        if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
-            self.add_error(f"Operador aritmético '{op}' no se puede aplicar a '{left_type}' y '{right_type}'",
-                           node.get('line'), node.get('column'))
-            return 'error', None
+        if left_type not in _NUMERIC or right_type not in _NUMERIC:
+            self.add_error("Operador aritmético '{}' no se puede aplicar a '{}' y '{}'",
+                           node['line'], node['column'], op, left_type, right_type)
+            return ERROR, None
 
-        result_type = 'float' if left_type == 'float' or right_type == 'float' else 'int'
+        result_type = FLOAT if left_type is FLOAT or right_type is FLOAT else INT
         result_val = self._calculate_arithmetic(op, left_val, right_val, result_type, node)
         
         return result_type, result_val
@@ -373,31 +607,28 @@ class SemanticAnalyzer:
         left_type, left_val = self.visit(node['children'][0])
         right_type, right_val = self.visit(node['children'][1])
 
-        if left_type == 'error' or right_type == 'error':
-            return 'bool', None # No es un error del nodo, sino de un hijo
+        if left_type is ERROR or right_type is ERROR:
+            return BOOL, None # No es un error del nodo, sino de un hijo
 
-        numeric_compat = left_type in ['int', 'float'] and right_type in ['int', 'float']
-        bool_compat = left_type == 'bool' and right_type == 'bool'
+        numeric_compat = left_type in _NUMERIC and right_type in _NUMERIC
+        bool_compat = left_type is BOOL and right_type is BOOL
 
         # --- MODIFICACIÓN 5: Marcar el nodo relacional como error ---
-        node_type = 'bool' # Asumir éxito
+        node_type = BOOL # Asumir éxito
 
         if not (numeric_compat or bool_compat):
-            self.add_error(f"Operador relacional '{op}' no se puede aplicar a '{left_type}' y '{right_type}'",
-                           node.get('line'), node.get('column'))
-            node_type = 'error' # ¡Marcar el nodo como erróneo!
+            self.add_error("Operador relacional '{}' no se puede aplicar a '{}' y '{}'",
+                           node['line'], node['column'], op, left_type, right_type)
+            node_type = ERROR # ¡Marcar el nodo como erróneo!
         
         result_val = None
         if left_val is not None and right_val is not None:
             try:
-                if op == '==': result_val = left_val == right_val
-                elif op == '!=': result_val = left_val != right_val
-                elif op == '<':  result_val = left_val < right_val
-                elif op == '>':  result_val = left_val > right_val
-                elif op == '<=': result_val = left_val <= right_val
-                elif op == '>=': result_val = left_val >= right_val
+                fn = _REL_OPS.get(op)
+                if fn is not None:
+                    result_val = fn(left_val, right_val)
             except Exception as e:
-                self.add_error(f"Error en operación relacional: {e}", node.get('line'), node.get('column'))
+                self.add_error("Error en operación relacional: {}", node['line'], node['column'], e)
                 result_val = None
 
         return node_type, result_val
@@ -409,32 +640,42 @@ class SemanticAnalyzer:
         result_val = None
         
         # --- MODIFICACIÓN 6: Marcar el nodo lógico como error ---
-        node_type = 'bool' # Asumir éxito
+        node_type = BOOL # Asumir éxito
         
         if op == '!': # Unario
             op_type, op_val = self.visit(node['children'][0])
-            if op_type not in ['bool', 'error']:
-                self.add_error(f"Operador lógico '!' no se puede aplicar a '{op_type}'",
-                               node.get('line'), node.get('column'))
-                node_type = 'error'
+            if op_type not in _BOOL_OR_ERR:
+                self.add_error("Operador lógico '!' no se puede aplicar a '{}'",
+                               node['line'], node['column'], op_type)
+                node_type = ERROR
             
             if op_val is not None:
                 result_val = not op_val
                 
         else: # Binario (&&, ||)
             left_type, left_val = self.visit(node['children'][0])
+
+            if left_type not in _BOOL_OR_ERR:
+                self.add_error("Operador lógico '{}' requiere 'bool', pero se encontró '{}' (izquierda)",
+                               node['line'], node['column'], op, left_type)
+                node_type = ERROR
+
+            # Cortocircuito: si el lado izquierdo ya decide el resultado,
+            # el subárbol derecho es código muerto y no se visita.
+            if node_type is BOOL:
+                if op == '&&' and left_val is False:
+                    return BOOL, False
+                if op == '||' and left_val is True:
+                    return BOOL, True
+
             right_type, right_val = self.visit(node['children'][1])
-            
-            if left_type not in ['bool', 'error']:
-                self.add_error(f"Operador lógico '{op}' requiere 'bool', pero se encontró '{left_type}' (izquierda)",
-                               node.get('line'), node.get('column'))
-                node_type = 'error'
-            if right_type not in ['bool', 'error']:
-                 self.add_error(f"Operador lógico '{op}' requiere 'bool', pero se encontró '{right_type}' (derecha)",
-                                node.get('line'), node.get('column'))
-                 node_type = 'error'
-
-            if left_type == 'error' or right_type == 'error':
+
+            if right_type not in _BOOL_OR_ERR:
+                 self.add_error("Operador lógico '{}' requiere 'bool', pero se encontró '{}' (derecha)",
+                                node['line'], node['column'], op, right_type)
+                 node_type = ERROR
+
+            if left_type is ERROR or right_type is ERROR:
                  if node_type != 'error': # Si no se marcó ya, pero hijos tienen error
                      pass # No lo marcamos como error, el hijo ya estará rojo
                  pass
@@ -451,51 +692,47 @@ class SemanticAnalyzer:
     def visit_id(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Verifica el uso de un ID, registra su aparición y devuelve su tipo y valor constante."""
         var_name = node.get('value')
-        line = node.get('line')
+        line = node['line']
 
-        if var_name in self.cross_reference_table:
-            self.cross_reference_table[var_name]['lines'].append(line)
+        self._pending_refs[var_name].append(line)
+
+        entry = self.symbol_table.get(var_name)
+        if entry is None:
+            self.add_error("Variable no declarada '{}'",
+                           line, node['column'], var_name)
+            return ERROR, None
 
-        if var_name not in self.symbol_table:
-            self.add_error(f"Variable no declarada '{var_name}'",
-                           node.get('line'), node.get('column'))
-            return 'error', None
-        
         # --- MODIFICACIÓN 7: Marcar 'id' no inicializado como error ---
-        if not self.symbol_table[var_name]['is_initialized']:
-            self.add_error(f"Variable '{var_name}' usada antes de ser inicializada",
-                           node.get('line'), node.get('column'))
-            #var_type = self.symbol_table[var_name]['type']
-            return 'error', None # Devuelve 'error' para que el nodo ID se pinte
+        if not entry.is_initialized:
+            self.add_error("Variable '{}' usada antes de ser inicializada",
+                           line, node['column'], var_name)
+            return ERROR, None # Devuelve 'error' para que el nodo ID se pinte
         # --- FIN DE MODIFICACIÓN 7 ---
 
-        var_type = self.symbol_table[var_name]['type']
-        const_val = self.symbol_table[var_name]['const_value']
-        
-        return var_type, const_val
+        return entry.type, entry.const_value
 
     def visit_numero(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Infiere el tipo y devuelve el valor numérico."""
         value_str = node.get('value', '')
         try:
             if '.' in value_str:
-                return 'float', float(value_str)
+                return FLOAT, float(value_str)
             else:
-                return 'int', int(value_str)
+                return INT, int(value_str)
         except ValueError:
-             self.add_error(f"Literal numérico mal formado '{value_str}'", node.get('line'), node.get('column'))
-             return 'error', None
+             self.add_error("Literal numérico mal formado '{}'", node['line'], node['column'], value_str)
+             return ERROR, None
 
 
     def visit_bool(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Devuelve el tipo y valor booleano."""
         value = (node.get('value') == 'true')
-        return 'bool', value
+        return BOOL, value
 
     def visit_cadena(self, node: Dict[str, Any]) -> Tuple[str, Any]:
         """Devuelve el tipo y valor de cadena."""
         value = node.get('value')
-        return 'string', value
+        return STRING, value
 
     # --- Salida y Reporte ---
 
@@ -507,31 +744,53 @@ class SemanticAnalyzer:
         
         sym_table_file = base_file_path.replace('.txt', '_symbol_table.json')
         try:
-            for var in self.cross_reference_table:
-                self.cross_reference_table[var]['lines'].sort() 
-                
+            xref = self.cross_reference_table
+            for var_name, lines in self._pending_refs.items():
+                pending_entry = xref.get(var_name)
+                if pending_entry is not None:
+                    pending_entry.lines.update(lines)
+            self._pending_refs.clear()
+
+            # Las entradas XRef se convierten a dicts sólo aquí, para el JSON.
+            xref_dict = {
+                var: {'type': entry.type, 'lines': sorted(entry.lines), 'address': entry.address}
+                for var, entry in self.cross_reference_table.items()
+            }
+
             with open(sym_table_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cross_reference_table, f, indent=2, ensure_ascii=False)
+                json.dump(xref_dict, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Error al guardar la tabla de símbolos: {e}", file=sys.stderr)
 
         annotated_ast_file = base_file_path.replace('.txt', '_annotated_ast.json')
         if self.ast:
             try:
-                with open(annotated_ast_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.ast, f, indent=2, ensure_ascii=False)
+                # El AST anotado puede ser enorme: orjson serializa en C y
+                # escribe bytes directamente; sin orjson se emite JSON
+                # compacto (sin indent) para evitar el camino lento del
+                # pretty-print puro-Python.
+                if orjson is not None:
+                    with open(annotated_ast_file, 'wb') as f:
+                        f.write(orjson.dumps(self.ast, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(annotated_ast_file, 'w', encoding='utf-8') as f:
+                        json.dump(self.ast, f, ensure_ascii=False)
             except Exception as e:
                 print(f"Error al guardar el AST anotado: {e}", file=sys.stderr)
         
         if self.errors:
+            # Import diferido: los programas sin errores (el caso común)
+            # no pagan el costo de importar prettytable.
+            from prettytable import PrettyTable
+
             error_table = PrettyTable()
             error_table.field_names = ["Descripción", "Línea", "Columna"]
             error_table.align = "l"
-            
+
             print("=== ERRORES SEMÁNTICOS ===", file=sys.stderr)
-            for error in self.errors:
-                error_table.add_row([error.description, error.line, error.column])
-            
+            error_table.add_rows([[error.description, error.line, error.column]
+                                  for error in self.errors])
+
             print(error_table, file=sys.stderr)
         else:
             pass
@@ -2,13 +2,21 @@
 # -*- coding: utf-8 -*-
 
 import sys
-import json
 import re
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
-from prettytable import PrettyTable
 import enum
 
+from lexical_analyzer import tokenize
+
+try:
+    import orjson
+except ImportError:
+    # Todos los usos de json quedan en ramas donde orjson falta, así que
+    # la stdlib sólo se importa cuando de verdad va a usarse.
+    import json
+    orjson = None
+
 # Definimos los tipos de tokens como un enumerado para alinearnos con ide copy.py
 class TokenType(enum.Enum):
     INTEGER = "INT"
@@ -30,7 +38,73 @@ class TokenType(enum.Enum):
     INCREMENT_OP = "INCREMENT_OP"
     DECREMENT_OP = "DECREMENT_OP"
 
-@dataclass
+# Etiquetas de tipo de token ligadas una vez a nivel de módulo: cada
+# acceso TokenType.X.value pasa por el descriptor del enum, y los
+# métodos de parseo las consultan varias veces por llamada.
+_T_INT = TokenType.INTEGER.value
+_T_REAL = TokenType.REAL.value
+_T_IDENT = TokenType.IDENTIFIER.value
+_T_KW = TokenType.RESERVED_WORD.value
+_T_ARITH = TokenType.ARITHMETIC_OPERATOR.value
+_T_LOGIC = TokenType.LOGICAL_OPERATOR.value
+_T_SYM = TokenType.SYMBOL.value
+_T_ASSIGN = TokenType.ASSIGNMENT.value
+_T_STREAM = TokenType.STREAM_OPERATOR.value
+_T_STRING = TokenType.STRING_LITERAL.value
+_T_INC = TokenType.INCREMENT_OP.value
+_T_DEC = TokenType.DECREMENT_OP.value
+
+# Conjuntos construidos una sola vez a nivel de módulo: los literales de
+# set/list dentro de los métodos se reconstruían en cada invocación.
+_SYNC = frozenset((';', '}', 'end', 'while', 'do', 'if', 'else', 'cin', 'cout',
+                   'then', 'main', 'int', 'float', 'bool', 'string', 'until'))
+_TYPE_KW = frozenset(('int', 'float', 'bool'))
+_COMPOUND_ASSIGN = frozenset(('+=', '-=', '*=', '/=', '%=', '^='))
+_BOOL_LITERALS = frozenset(('true', 'false'))
+_THEN_STOPS = frozenset(('else', 'end'))
+_ASSIGN_TOKEN_TYPES = frozenset((_T_ASSIGN, _T_INC,
+                                 _T_DEC, _T_ARITH))
+
+# Centinela compartido para nodos hoja: evita asignar una lista vacía por
+# cada envoltorio de token ('if', ';', id, numero...); add_child la
+# materializa en lista sólo si el nodo llega a tener hijos.
+_EMPTY: tuple = ()
+
+# Tope de errores reportados: en entradas muy rotas el ciclo error →
+# synchronize → error puede producir miles de entradas que luego hay
+# que formatear; pasado el tope se registra un marcador y se calla.
+_MAX_ERRORS = 100
+
+# Tabla del analizador de expresiones por precedencias (Pratt):
+# valor del operador -> (nivel, tipo de nodo, asociativa a la izquierda).
+# Reproduce exactamente la jerarquía de los antiguos parse_expresion /
+# parse_expresion_simple / parse_termino / parse_factor, incluida la
+# asociatividad a la derecha de los operadores lógicos.
+_EXPR_OPS = {
+    '&&': (1, 'expresion_logica', False),
+    '||': (1, 'expresion_logica', False),
+    '!':  (1, 'expresion_logica', False),
+    '==': (2, 'expresion_relacional', True),
+    '!=': (2, 'expresion_relacional', True),
+    '<':  (2, 'expresion_relacional', True),
+    '>':  (2, 'expresion_relacional', True),
+    '<=': (2, 'expresion_relacional', True),
+    '>=': (2, 'expresion_relacional', True),
+    '+':  (3, 'expresion_simple', True),
+    '-':  (3, 'expresion_simple', True),
+    '++': (3, 'expresion_simple', True),
+    '--': (3, 'expresion_simple', True),
+    '*':  (4, 'termino', True),
+    '/':  (4, 'termino', True),
+    '%':  (4, 'termino', True),
+    '^':  (5, 'factor', True),
+}
+
+# Qué se esperaba tras un operador de cada nivel, para los diagnósticos.
+_EXPR_EXPECTED = {1: 'una expresión', 2: 'una expresión', 3: 'un término',
+                  4: 'un factor', 5: 'un componente'}
+
+@dataclass(slots=True)
 class Token:
     token_type: str
     value: str
@@ -38,34 +112,69 @@ class Token:
     column: int
 
 class ASTNode:
+    # Sin __dict__ por instancia: el AST crea miles de nodos y los slots
+    # reducen su tamaño y aceleran el acceso a atributos en la recursión.
+    __slots__ = ('node_type', 'value', 'line', 'column', 'children')
+
     def __init__(self, node_type: str, value: str = None, line: int = None, column: int = None, children: List['ASTNode'] = None):
         self.node_type = node_type
         self.value = value
         self.line = line
         self.column = column
-        self.children = children or []
-    
+        self.children = children or _EMPTY
+
     def add_child(self, child: 'ASTNode'):
         if child:
-            self.children.append(child)
+            if self.children is _EMPTY:
+                self.children = [child]
+            else:
+                self.children.append(child)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert AST node to dictionary for JSON serialization"""
-        result = {
-            "node_type": self.node_type,
-            "value": self.value,
-            "line": self.line,
-            "column": self.column,
-            "children": [child.to_dict() for child in self.children]
-        }
-        return result
+        """Convert AST node to dictionary for JSON serialization.
+
+        Iterativo con pila explícita: las cadenas largas de '+'/'*' se
+        asocian a la izquierda y producían una recursión O(N) en
+        profundidad, un frame de Python por nodo."""
+        root = None
+        stack = [(self, None)]
+        while stack:
+            node, parent_children = stack.pop()
+            d = {
+                "node_type": node.node_type,
+                "value": node.value,
+                "line": node.line,
+                "column": node.column,
+                "children": []
+            }
+            if parent_children is None:
+                root = d
+            else:
+                parent_children.append(d)
+            for child in reversed(node.children):
+                stack.append((child, d["children"]))
+        return root
+
+def _ast_default(obj):
+    """Codificador para orjson: serializa ASTNode sin pasar por to_dict,
+    evitando materializar el árbol de dicts intermedio."""
+    if isinstance(obj, ASTNode):
+        return {"node_type": obj.node_type, "value": obj.value, "line": obj.line,
+                "column": obj.column, "children": obj.children}
+    raise TypeError
+
+class ParseError(Exception):
+    """Error sintáctico registrado por el parser. Antes se llamaba
+    SyntaxError, lo que ensombrecía la excepción incorporada de Python
+    dentro de este módulo."""
+    __slots__ = ('description', 'line', 'column')
 
-class SyntaxError:
     def __init__(self, description: str, line: int, column: int):
+        super().__init__(description)
         self.description = description
         self.line = line
         self.column = column
-    
+
     def __str__(self):
         return f"Error: {self.description} (Línea {self.line}, Columna {self.column})"
 
@@ -76,87 +185,67 @@ class SyntaxAnalyzer:
         self.current_token = None
         self.errors = []
         self.ast = None
+        self._ast_dict = None  # to_dict() memorizado (solo ruta sin orjson)
         self.error_locations = set()  # Track errors to avoid duplicates
+
+        # Despacho de sentencias por palabra clave: un acceso por hash en
+        # lugar de la cadena de match() en parse_sentencia.
+        self._stmt_dispatch = {
+            'if': self.parse_seleccion,
+            'while': self.parse_iteracion,
+            'do': self.parse_repeticion,
+            'cin': self.parse_sent_in,
+            'cout': self.parse_sent_out,
+        }
     
     def load_tokens(self, file_path: str):
-        """Load tokens from lexical analyzer output file"""
+        """Load tokens by running the lexical analyzer in-process"""
         try:
-            import subprocess
-            import os
-            
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            lexical_analyzer_path = os.path.join(script_dir, 'lexical_analyzer.py')
-            
-            result = subprocess.run(
-                ['python', lexical_analyzer_path, file_path],
-                capture_output=True,
-                text=True,
-                encoding='utf-8'
-            )
-            
-            self.tokens = self._parse_tokens_from_output(result.stdout)
-            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                code = f.read()
+
+            # Mapeamos los tipos de tokens del léxico a los de TokenType:
+            # el léxico etiqueta '++'/'--' como INCREMENT/DECREMENT y
+            # '<<'/'>>' como LOGIC_OP; el resto coincide directamente.
+            tokens = []
+            for lex_token in tokenize(code):
+                # Internamos tipo y valor: los tipos forman un conjunto
+                # cerrado y los valores se repiten mucho, así que match()
+                # y _accept() pueden comparar por identidad.
+                token_type = sys.intern(lex_token.token_type)
+                value = sys.intern(lex_token.value)
+                if token_type == 'INCREMENT':
+                    token_type = _T_INC
+                elif token_type == 'DECREMENT':
+                    token_type = _T_DEC
+                elif value == '>>' or value == '<<':
+                    token_type = _T_STREAM
+                tokens.append(Token(token_type, value, lex_token.line, lex_token.column))
+            self.tokens = tokens
+
             if not self.tokens:
+                import os
                 tokens_file = file_path.replace('.txt', '_tokens.json')
                 if os.path.exists(tokens_file):
-                    with open(tokens_file, 'r', encoding='utf-8') as f:
-                        tokens_data = json.load(f)
-                        self.tokens = [Token(**token_data) for token_data in tokens_data]
-                        
+                    if orjson is not None:
+                        with open(tokens_file, 'rb') as f:
+                            tokens_data = orjson.loads(f.read())
+                    else:
+                        with open(tokens_file, 'r', encoding='utf-8') as f:
+                            tokens_data = json.load(f)
+                    self.tokens = [Token(sys.intern(d['token_type']), sys.intern(d['value']),
+                                         d['line'], d['column']) for d in tokens_data]
+
         except Exception as e:
             print(f"Error loading tokens: {e}", file=sys.stderr)
             return False
-        
+
         if self.tokens:
             self.current_token_index = -1
             self.advance()  # Inicializamos el primer token
             return True
         return False
     
-    def _parse_tokens_from_output(self, output: str) -> List[Token]:
-        """Parse tokens from lexical analyzer output"""
-        tokens = []
-        lines = output.split('\n')
-        skip_tokens = {'WHITESPACE', 'NEWLINE', 'COMMENT_SINGLE', 'COMMENT_MULTI', 'COMMENT'}
-        
-        for line in lines:
-            line = line.strip()
-            if '|' in line and not line.startswith('+') and not line.startswith('='):
-                parts = [part.strip() for part in line.split('|')]
-                if len(parts) >= 5 and parts[1] not in ['Token Type', '']:
-                    try:
-                        token_type = parts[1]
-                        value = parts[2]
-                        line_num = int(parts[3])
-                        column = int(parts[4])
-                        
-                        # Mapeamos los tipos de tokens a los de TokenType
-                        if value == '++':
-                            token_type = TokenType.INCREMENT_OP.value
-                        elif value == '--':
-                            token_type = TokenType.DECREMENT_OP.value
-                        elif value == '^' or value == '%':
-                            token_type = TokenType.ARITHMETIC_OPERATOR.value
-                        elif value in ['+', '-', '*', '/', '+=', '-=', '*=', '/=', '%=', '^=']:
-                            token_type = TokenType.ARITHMETIC_OPERATOR.value
-                        elif value in ['=', '==', '!=', '<', '>', '<=', '>=']:
-                            token_type = TokenType.ASSIGNMENT.value if value == '=' else TokenType.RELATIONAL_OPERATOR.value
-                        elif value in ['&&', '||', '!']:
-                            token_type = TokenType.LOGICAL_OPERATOR.value
-                        elif value in ['>>', '<<']:
-                            token_type = TokenType.STREAM_OPERATOR.value
-                        elif value in ['(', ')', '{', '}', ',', ';', '[', ']']:
-                            token_type = TokenType.SYMBOL.value
-                        elif token_type == 'KEYWORD' and value in ['true', 'false']:
-                            token_type = TokenType.RESERVED_WORD.value
-                        
-                        if token_type not in skip_tokens:
-                            tokens.append(Token(token_type, value, line_num, column))
-                    except (ValueError, IndexError):
-                        continue
-        
-        return tokens
-    
     def advance(self):
         """Move to the next token"""
         self.current_token_index += 1
@@ -178,11 +267,23 @@ class SyntaxAnalyzer:
         if not self.current_token:
             return False
         
-        type_matches = self.current_token.token_type == expected_type
+        # Los tipos están internados en load_tokens: basta la identidad.
+        type_matches = self.current_token.token_type is expected_type
         value_matches = expected_value is None or self.current_token.value == expected_value
-        
+
         return type_matches and value_matches
     
+    def _accept(self, expected_type: str, expected_value: str = None) -> Optional[Token]:
+        """Consume y devuelve el token actual si coincide, o None si no.
+        Una sola comprobación en lugar del par match()+consume(), para los
+        puntos de decisión LL(1) donde no coincidir no es un error."""
+        token = self.current_token
+        if token is not None and token.token_type is expected_type and \
+           (expected_value is None or token.value == expected_value):
+            self.advance()
+            return token
+        return None
+
     def consume(self, expected_type: str, expected_value: str = None, optional: bool = False) -> Optional[Token]:
         """Consume current token if it matches expected type/value"""
         if self.match(expected_type, expected_value):
@@ -190,33 +291,45 @@ class SyntaxAnalyzer:
             self.advance()
             return token
         if not optional:
-            error_msg = f"Se esperaba '{expected_value or expected_type}' pero se encontró '{self.current_token.value if self.current_token else 'EOF'}'"
-            error_location = (self.current_token.line if self.current_token else 0,
-                            self.current_token.column if self.current_token else 0,
-                            error_msg)
+            token = self.current_token
+            # Clave entera línea*100000+columna: deduplicar por posición
+            # evita armar y hashear una tupla con el mensaje incluido; si
+            # dos reglas fallan sobre el mismo token sólo se reporta la
+            # primera.
+            error_location = (token.line * 100000 + token.column) if token else 0
             if error_location not in self.error_locations:
                 self.error_locations.add(error_location)
+                error_msg = f"Se esperaba '{expected_value or expected_type}' pero se encontró '{token.value if token else 'EOF'}'"
                 self.error(error_msg)
         return None
     
     def error(self, message: str, line: int = None, column: int = None):
         """Add a syntax error"""
-        error = SyntaxError(
+        errors = self.errors
+        if len(errors) >= _MAX_ERRORS:
+            return
+        error = ParseError(
             message,
             line if line is not None else (self.current_token.line if self.current_token else 0),
             column if column is not None else (self.current_token.column if self.current_token else 0)
         )
-        self.errors.append(error)
+        errors.append(error)
+        if len(errors) == _MAX_ERRORS:
+            errors.append(ParseError(
+                f"Demasiados errores ({_MAX_ERRORS}); se omiten los siguientes",
+                error.line, error.column))
     
     def synchronize(self, recover_token: str = None, recover_type: str = None):
         """Synchronize after an error by skipping to next statement"""
-        sync_tokens = {';', '}', 'end', 'while', 'do', 'if', 'else', 'cin', 'cout', 'then', 'main', 'int', 'float', 'bool', 'string', 'until'}
-        
+        # Método acotado resuelto una vez: ahorra un LOAD_GLOBAL+contains
+        # por token descartado durante la recuperación.
+        in_sync = _SYNC.__contains__
         while self.current_token:
-            if (recover_token and self.current_token.value == recover_token) or \
+            value = self.current_token.value
+            if (recover_token and value == recover_token) or \
                (recover_type and self.current_token.token_type == recover_type) or \
-               self.current_token.value in sync_tokens:
-                if self.current_token.value in sync_tokens:
+               in_sync(value):
+                if in_sync(value):
                     self.advance()
                 break
             self.advance()
@@ -236,12 +349,12 @@ class SyntaxAnalyzer:
         """programa → main { lista_declaracion }"""
         try:
             program_node = ASTNode("programa", line=1, column=1)
-            main_token = self.consume(TokenType.RESERVED_WORD.value, 'main')
+            main_token = self.consume(_T_KW, 'main')
             if not main_token:
                 return program_node
             program_node.add_child(ASTNode("main", main_token.value, main_token.line, main_token.column))
             
-            if not self.consume(TokenType.SYMBOL.value, '{'):
+            if not self.consume(_T_SYM, '{'):
                 return program_node
             program_node.add_child(ASTNode("{", "{", main_token.line, main_token.column))
             
@@ -249,7 +362,7 @@ class SyntaxAnalyzer:
             if declarations:
                 program_node.add_child(declarations)
             
-            if not self.consume(TokenType.SYMBOL.value, '}', optional=True):
+            if not self.consume(_T_SYM, '}', optional=True):
                 self.synchronize(recover_token='}')
                 if self.current_token and self.current_token.value == '}':
                     self.advance()
@@ -263,59 +376,70 @@ class SyntaxAnalyzer:
     
     def parse_lista_declaracion(self) -> Optional[ASTNode]:
         """lista_declaracion → (declaracion_variable | sentencia)*"""
-        nodo = ASTNode("lista_declaracion")
-        while self.current_token and self.current_token.value != '}':
+        # Los hijos se acumulan en una lista local con el append ya
+        # resuelto; una sola asignación a nodo.children al final.
+        kids = []
+        append = kids.append
+        # El token actual se relee en un local por iteración: un solo
+        # LOAD_ATTR en lugar de tres.
+        token = self.current_token
+        while token is not None and token.value != '}':
             try:
-                if self.current_token.value in ['int', 'float', 'bool']:
+                if token.value in _TYPE_KW:
                     decl = self.parse_declaracion_variable()
                     if decl:
-                        nodo.add_child(decl)
+                        append(decl)
                 else:
                     stmt = self.parse_sentencia()
                     if stmt:
-                        nodo.add_child(stmt)
+                        append(stmt)
             except Exception as e:
                 self.error(f"Error en declaración: {str(e)}")
                 self.synchronize(recover_token=';')
-        return nodo if nodo.children else None
+            token = self.current_token
+        if not kids:
+            return None
+        return ASTNode("lista_declaracion", children=kids)
     
     def parse_declaracion_variable(self) -> Optional[ASTNode]:
         """declaracion_variable → tipo identificador ( , identificador )* ;"""
         try:
             start_token = self.current_token
-            tipo_token = self.consume(TokenType.RESERVED_WORD.value)
-            if not tipo_token or tipo_token.value not in ['int', 'float', 'bool']:
+            tipo_token = self.consume(_T_KW)
+            if not tipo_token or tipo_token.value not in _TYPE_KW:
                 self.error(f"Tipo de dato no válido: {tipo_token.value if tipo_token else 'ninguno'}")
                 self.synchronize(recover_token=';')
                 return ASTNode("declaracion_variable", value="unknown", children=[])
             
             nodo = ASTNode("declaracion_variable", tipo_token.value, tipo_token.line, tipo_token.column)
-            id_token = self.consume(TokenType.IDENTIFIER.value)
+            id_token = self.consume(_T_IDENT)
             if id_token:
                 nodo.add_child(ASTNode("id", id_token.value, id_token.line, id_token.column))
             
-            while self.match(TokenType.SYMBOL.value, ','):
-                self.advance()
-                next_id = self.consume(TokenType.IDENTIFIER.value)
+            while self._accept(_T_SYM, ','):
+                next_id = self.consume(_T_IDENT)
                 if next_id:
                     nodo.add_child(ASTNode("id", next_id.value, next_id.line, next_id.column))
                 else:
                     self.error("Se esperaba un identificador después de ','")
                     break
             
-            expected_col = start_token.column + len(tipo_token.value) + sum(
-                len(child.value) + 2 for child in nodo.children
-            ) - 1
-            if not self.current_token or self.current_token.value != ';':
-                if self.current_token and self.current_token.token_type == TokenType.RESERVED_WORD.value and \
-                   self.current_token.value in ['int', 'float', 'bool']:
-                    self.error(f"Se esperaba ';' y se encontró '{self.current_token.value}'", expected_col=expected_col)
+            token = self.current_token
+            if token is None or token.value != ';':
+                # La columna estimada del ';' faltante se calcula sólo al
+                # emitir el error; antes se sumaba sobre todos los hijos en
+                # cada declaración y se pasaba como un kwarg que error() no
+                # acepta, reventando justamente la ruta de error.
+                expected_col = start_token.column + len(tipo_token.value) + 1
+                if token is not None and token.token_type is _T_KW and \
+                   token.value in _TYPE_KW:
+                    self.error(f"Se esperaba ';' y se encontró '{token.value}'", column=expected_col)
                     return nodo
                 else:
-                    self.error("Se esperaba ';'", expected_col=expected_col)
+                    self.error("Se esperaba ';'", column=expected_col)
                     self.synchronize(recover_token=';')
             else:
-                self.consume(TokenType.SYMBOL.value, ';')
+                self.consume(_T_SYM, ';')
             
             return nodo
         except Exception as e:
@@ -328,27 +452,22 @@ class SyntaxAnalyzer:
         if not self.current_token:
             return None
         
-        if self.match(TokenType.SYMBOL.value, ';'):
+        if self.match(_T_SYM, ';'):
             self.advance()
             return ASTNode("sent_expresion")
         
         try:
-            if self.match(TokenType.RESERVED_WORD.value, 'if'):
-                return self.parse_seleccion()
-            elif self.match(TokenType.RESERVED_WORD.value, 'while'):
-                return self.parse_iteracion()
-            elif self.match(TokenType.RESERVED_WORD.value, 'do'):
-                return self.parse_repeticion()
-            elif self.match(TokenType.RESERVED_WORD.value, 'cin'):
-                return self.parse_sent_in()
-            elif self.match(TokenType.RESERVED_WORD.value, 'cout'):
-                return self.parse_sent_out()
-            elif self.match(TokenType.IDENTIFIER.value):
+            token = self.current_token
+            if token.token_type is _T_KW:
+                handler = self._stmt_dispatch.get(token.value)
+                if handler is not None:
+                    return handler()
+            elif token.token_type is _T_IDENT:
                 return self.parse_asignacion()
-            else:
-                self.error(f"Sentencia no válida: {self.current_token.value}")
-                self.synchronize(recover_token=';')
-                return None
+
+            self.error(f"Sentencia no válida: {token.value}")
+            self.synchronize(recover_token=';')
+            return None
         except Exception as e:
             self.error(f"Error procesando sentencia: {str(e)}")
             self.synchronize(recover_token=';')
@@ -358,32 +477,35 @@ class SyntaxAnalyzer:
         """seleccion → if expresion then lista_sentencias [ else lista_sentencias ] end"""
         try:
             nodo = ASTNode("seleccion", line=self.current_token.line, column=self.current_token.column)
-            if_token = self.consume(TokenType.RESERVED_WORD.value, 'if')
+            kids = []
+            append = kids.append
+            if_token = self.consume(_T_KW, 'if')
             if if_token:
-                nodo.add_child(ASTNode("if", if_token.value, if_token.line, if_token.column))
-            
+                append(ASTNode("if", if_token.value, if_token.line, if_token.column))
+
             expr = self.parse_expresion()
             if expr:
-                nodo.add_child(expr)
-            
-            then_token = self.consume(TokenType.RESERVED_WORD.value, 'then')
+                append(expr)
+
+            then_token = self.consume(_T_KW, 'then')
             if then_token:
-                nodo.add_child(ASTNode("then", then_token.value, then_token.line, then_token.column))
-            
+                append(ASTNode("then", then_token.value, then_token.line, then_token.column))
+
             then_block = self.parse_lista_sentencias(context='if_then')
             if then_block:
-                nodo.add_child(ASTNode("then_block", children=then_block.children))
-            
-            if self.match(TokenType.RESERVED_WORD.value, 'else'):
-                else_token = self.consume(TokenType.RESERVED_WORD.value, 'else')
-                if else_token:
-                    nodo.add_child(ASTNode("else", else_token.value, else_token.line, else_token.column))
-                    else_block = self.parse_lista_sentencias(context='if_else')
-                    if else_block:
-                        nodo.add_child(ASTNode("else_block", children=else_block.children))
-            
-            self.consume(TokenType.RESERVED_WORD.value, 'end', optional=True)
-            
+                append(ASTNode("then_block", children=then_block.children))
+
+            else_token = self._accept(_T_KW, 'else')
+            if else_token:
+                append(ASTNode("else", else_token.value, else_token.line, else_token.column))
+                else_block = self.parse_lista_sentencias(context='if_else')
+                if else_block:
+                    append(ASTNode("else_block", children=else_block.children))
+
+            self.consume(_T_KW, 'end', optional=True)
+
+            if kids:
+                nodo.children = kids
             return nodo
         except Exception as e:
             self.error(f"Error en estructura if: {str(e)}")
@@ -394,20 +516,24 @@ class SyntaxAnalyzer:
         """iteracion → while expresion lista_sentencias end"""
         try:
             nodo = ASTNode("iteracion", line=self.current_token.line, column=self.current_token.column)
-            while_token = self.consume(TokenType.RESERVED_WORD.value, 'while')
+            kids = []
+            append = kids.append
+            while_token = self.consume(_T_KW, 'while')
             if while_token:
-                nodo.add_child(ASTNode("while", while_token.value, while_token.line, while_token.column))
-            
+                append(ASTNode("while", while_token.value, while_token.line, while_token.column))
+
             expr = self.parse_expresion()
             if expr:
-                nodo.add_child(ASTNode("condicion", children=[expr]))
-            
+                append(ASTNode("condicion", children=[expr]))
+
             body = self.parse_lista_sentencias(context='while')
             if body:
-                nodo.add_child(ASTNode("cuerpo", children=body.children))
-            
-            self.consume(TokenType.RESERVED_WORD.value, 'end', optional=True)
-            
+                append(ASTNode("cuerpo", children=body.children))
+
+            self.consume(_T_KW, 'end', optional=True)
+
+            if kids:
+                nodo.children = kids
             return nodo
         except Exception as e:
             self.error(f"Error en estructura while: {str(e)}")
@@ -418,24 +544,28 @@ class SyntaxAnalyzer:
         """repeticion → do lista_sentencias until expresion ;"""
         try:
             nodo = ASTNode("repeticion", line=self.current_token.line, column=self.current_token.column)
-            do_token = self.consume(TokenType.RESERVED_WORD.value, 'do')
+            kids = []
+            append = kids.append
+            do_token = self.consume(_T_KW, 'do')
             if do_token:
-                nodo.add_child(ASTNode("do", do_token.value, do_token.line, do_token.column))
-            
+                append(ASTNode("do", do_token.value, do_token.line, do_token.column))
+
             body = self.parse_lista_sentencias(context='do_until')
             if body:
-                nodo.add_child(ASTNode("cuerpo", children=body.children))
-            
-            until_token = self.consume(TokenType.RESERVED_WORD.value, 'until')
+                append(ASTNode("cuerpo", children=body.children))
+
+            until_token = self.consume(_T_KW, 'until')
             if until_token:
-                nodo.add_child(ASTNode("until", until_token.value, until_token.line, until_token.column))
-            
+                append(ASTNode("until", until_token.value, until_token.line, until_token.column))
+
             expr = self.parse_expresion()
             if expr:
-                nodo.add_child(ASTNode("condicion", children=[expr]))
-            
-            self.consume(TokenType.SYMBOL.value, ';', optional=True)
-            
+                append(ASTNode("condicion", children=[expr]))
+
+            self.consume(_T_SYM, ';', optional=True)
+
+            if kids:
+                nodo.children = kids
             return nodo
         except Exception as e:
             self.error(f"Error en estructura do-until: {str(e)}")
@@ -446,23 +576,25 @@ class SyntaxAnalyzer:
         """sent_in → cin >> id ( >> id )* ;"""
         try:
             nodo = ASTNode("sent_in", line=self.current_token.line, column=self.current_token.column)
-            cin_token = self.consume(TokenType.RESERVED_WORD.value, 'cin')
+            kids = []
+            append = kids.append
+            cin_token = self.consume(_T_KW, 'cin')
             if cin_token:
-                nodo.add_child(ASTNode("cin", cin_token.value, cin_token.line, cin_token.column))
-            
-            while self.match(TokenType.STREAM_OPERATOR.value, '>>'):
-                op_token = self.consume(TokenType.STREAM_OPERATOR.value, '>>')
-                if op_token:
-                    nodo.add_child(ASTNode(">>", op_token.value, op_token.line, op_token.column))
-                
-                id_token = self.consume(TokenType.IDENTIFIER.value)
+                append(ASTNode("cin", cin_token.value, cin_token.line, cin_token.column))
+
+            while (op_token := self._accept(_T_STREAM, '>>')):
+                append(ASTNode(">>", op_token.value, op_token.line, op_token.column))
+
+                id_token = self.consume(_T_IDENT)
                 if id_token:
-                    nodo.add_child(ASTNode("id", id_token.value, id_token.line, id_token.column))
+                    append(ASTNode("id", id_token.value, id_token.line, id_token.column))
                 else:
                     self.error("Se esperaba un identificador después de '>>'")
                     break
-            
-            self.consume(TokenType.SYMBOL.value, ';', optional=True)
+
+            if kids:
+                nodo.children = kids
+            self.consume(_T_SYM, ';', optional=True)
             return nodo
         except Exception as e:
             self.error(f"Error en sentencia cin: {str(e)}")
@@ -473,27 +605,29 @@ class SyntaxAnalyzer:
         """sent_out → cout << (cadena | expresion) ( << (cadena | expresion) )* ;"""
         try:
             nodo = ASTNode("sent_out", line=self.current_token.line, column=self.current_token.column)
-            cout_token = self.consume(TokenType.RESERVED_WORD.value, 'cout')
+            kids = []
+            append = kids.append
+            cout_token = self.consume(_T_KW, 'cout')
             if cout_token:
-                nodo.add_child(ASTNode("cout", cout_token.value, cout_token.line, cout_token.column))
-            
-            while self.match(TokenType.STREAM_OPERATOR.value, '<<'):
-                op_token = self.consume(TokenType.STREAM_OPERATOR.value, '<<')
-                if op_token:
-                    nodo.add_child(ASTNode("<<", op_token.value, op_token.line, op_token.column))
-                
-                if self.match(TokenType.STRING_LITERAL.value):
-                    string_token = self.consume(TokenType.STRING_LITERAL.value)
-                    nodo.add_child(ASTNode("cadena", string_token.value, string_token.line, string_token.column))
+                append(ASTNode("cout", cout_token.value, cout_token.line, cout_token.column))
+
+            while (op_token := self._accept(_T_STREAM, '<<')):
+                append(ASTNode("<<", op_token.value, op_token.line, op_token.column))
+
+                string_token = self._accept(_T_STRING)
+                if string_token:
+                    append(ASTNode("cadena", string_token.value, string_token.line, string_token.column))
                 else:
                     expr = self.parse_expresion()
                     if expr:
-                        nodo.add_child(expr)
+                        append(expr)
                     else:
                         self.error("Se esperaba una cadena o expresión después de '<<'")
                         break
-            
-            self.consume(TokenType.SYMBOL.value, ';', optional=True)
+
+            if kids:
+                nodo.children = kids
+            self.consume(_T_SYM, ';', optional=True)
             return nodo
         except Exception as e:
             self.error(f"Error en sentencia cout: {str(e)}")
@@ -503,40 +637,45 @@ class SyntaxAnalyzer:
     def parse_asignacion(self) -> Optional[ASTNode]:
         """asignacion → id ( = | ++ | -- | += | -= | *= | /= | %= | ^= ) (expresion | cadena) ;"""
         try:
-            id_token = self.consume(TokenType.IDENTIFIER.value)
+            id_token = self.consume(_T_IDENT)
             if not id_token:
                 self.error("Se esperaba un identificador")
                 return ASTNode("asignacion", value="error", children=[])
             
             op_token = self.current_token
-            if not op_token or op_token.token_type not in [TokenType.ASSIGNMENT.value, TokenType.INCREMENT_OP.value, 
-                                                        TokenType.DECREMENT_OP.value, TokenType.ARITHMETIC_OPERATOR.value]:
+            if not op_token or op_token.token_type not in _ASSIGN_TOKEN_TYPES:
                 self.error("Se esperaba '=', '++', '--' o operador compuesto en la asignación")
                 self.synchronize(recover_token=';')
                 return ASTNode("asignacion", value=id_token.value, children=[])
             
             self.advance()
-            nodo = ASTNode("asignacion", id_token.value, op_token.line, op_token.column)
-            nodo.add_child(ASTNode("id", id_token.value, id_token.line, id_token.column))
-            
-            if op_token.value in ['++', '--']:
-                operation = ASTNode("expresion_simple", '+' if op_token.value == '++' else '-', op_token.line, op_token.column)
-                operation.add_child(ASTNode("id", id_token.value, id_token.line, id_token.column))
-                operation.add_child(ASTNode("numero", "1", op_token.line, op_token.column))
+            # Un solo nodo 'id' compartido entre el lado izquierdo y el
+            # operando del azucarado ++/--/op=: el árbol sólo se recorre
+            # en lectura, así que compartir la hoja evita el duplicado.
+            id_node = ASTNode("id", id_token.value, id_token.line, id_token.column)
+            nodo = ASTNode("asignacion", id_token.value, op_token.line, op_token.column,
+                           children=[id_node])
+
+            if op_token.value in ('++', '--'):
+                # Hijos conocidos y no nulos: se construyen en línea, sin
+                # pasar por la guarda de add_child.
+                operation = ASTNode("expresion_simple", '+' if op_token.value == '++' else '-',
+                                    op_token.line, op_token.column,
+                                    children=[id_node,
+                                              ASTNode("numero", "1", op_token.line, op_token.column)])
                 nodo.add_child(operation)
-            elif op_token.value in ['+=', '-=', '*=', '/=', '%=', '^=']:
+            elif op_token.value in _COMPOUND_ASSIGN:
                 operator = op_token.value[0]
                 right_expr = self.parse_expresion()
                 if right_expr:
-                    operation = ASTNode("expresion_simple", operator, op_token.line, op_token.column)
-                    operation.add_child(ASTNode("id", id_token.value, id_token.line, id_token.column))
-                    operation.add_child(right_expr)
+                    operation = ASTNode("expresion_simple", operator, op_token.line, op_token.column,
+                                        children=[id_node, right_expr])
                     nodo.add_child(operation)
                 else:
                     self.error(f"Se esperaba una expresión después de '{op_token.value}'")
             elif op_token.value == '=':
-                if self.match(TokenType.STRING_LITERAL.value):
-                    string_token = self.consume(TokenType.STRING_LITERAL.value)
+                string_token = self._accept(_T_STRING)
+                if string_token:
                     nodo.add_child(ASTNode("cadena", string_token.value, string_token.line, string_token.column))
                 else:
                     expr = self.parse_expresion()
@@ -545,7 +684,7 @@ class SyntaxAnalyzer:
                     else:
                         self.error("Se esperaba una expresión o cadena después de '='")
             
-            self.consume(TokenType.SYMBOL.value, ';', optional=True)
+            self.consume(_T_SYM, ';', optional=True)
             return nodo
         except Exception as e:
             self.error(f"Error en asignación: {str(e)}")
@@ -554,16 +693,21 @@ class SyntaxAnalyzer:
     
     def parse_lista_sentencias(self, context: str = 'default') -> Optional[ASTNode]:
         """lista_sentencias → sentencia*"""
-        nodo = ASTNode("lista_sentencias")
-        while self.current_token and not self.should_stop_parsing(context):
+        kids = []
+        append = kids.append
+        # Enlaces a métodos resueltos una vez fuera del bucle.
+        should_stop = self.should_stop_parsing
+        while self.current_token is not None and not should_stop(context):
             try:
                 sent = self.parse_sentencia()
                 if sent:
-                    nodo.add_child(sent)
+                    append(sent)
             except Exception as e:
                 self.error(f"Error en sentencia: {str(e)}")
                 self.synchronize(recover_token=';')
-        return nodo if nodo.children else None
+        if not kids:
+            return None
+        return ASTNode("lista_sentencias", children=kids)
     
     def should_stop_parsing(self, context: str) -> bool:
         """Determina si se debe detener el parsing según el contexto"""
@@ -571,8 +715,8 @@ class SyntaxAnalyzer:
             return True
         
         value = self.current_token.value
-        if self.current_token.token_type == TokenType.RESERVED_WORD.value and \
-           value in ['int', 'float', 'bool']:
+        if self.current_token.token_type is _T_KW and \
+           value in _TYPE_KW:
             return True
         
         if context == 'default':
@@ -582,174 +726,129 @@ class SyntaxAnalyzer:
         elif context == 'do_until':
             return value == 'until'
         elif context == 'if_then':
-            return value in ['else', 'end']
+            return value in _THEN_STOPS
         elif context == 'if_else':
             return value == 'end'
         
         return False
     
-    def parse_expresion(self) -> Optional[ASTNode]:
-        """expresion → expresion_simple [ rel_op expresion_simple | op_logico expresion ]"""
-        left = self.parse_expresion_simple()
-        if not left:
-            return None
-        
-        while self.current_token and (
-            self.current_token.token_type == TokenType.RELATIONAL_OPERATOR.value or
-            self.current_token.token_type == TokenType.LOGICAL_OPERATOR.value
-        ):
-            if self.current_token.token_type == TokenType.RELATIONAL_OPERATOR.value:
-                op_token = self.consume(TokenType.RELATIONAL_OPERATOR.value)
-                right = self.parse_expresion_simple()
-                if right:
-                    left = ASTNode("expresion_relacional", op_token.value, op_token.line, op_token.column, children=[left, right])
-                else:
-                    self.error(f"Se esperaba una expresión después de '{op_token.value}'")
-                    break
-            else:
-                op_token = self.consume(TokenType.LOGICAL_OPERATOR.value)
-                right = self.parse_expresion()
-                if right:
-                    left = ASTNode("expresion_logica", op_token.value, op_token.line, op_token.column, children=[left, right])
-                else:
-                    self.error(f"Se esperaba una expresión después de '{op_token.value}'")
-                    break
-        
-        return left
-    
-    def parse_expresion_simple(self) -> Optional[ASTNode]:
-        """expresion_simple → termino ( ( + | - | ++ | -- ) termino )*"""
-        left = self.parse_termino()
+    def parse_expresion(self, min_prec: int = 1) -> Optional[ASTNode]:
+        """expresion → escalada de precedencias sobre _EXPR_OPS.
+
+        Un solo método Pratt en lugar de los cuatro niveles recursivos
+        (expresion / expresion_simple / termino / factor): un acceso a la
+        tabla por operador en vez de tres frames de Python. Los tipos de
+        nodo y la forma del árbol son los mismos de antes."""
+        left = self.parse_componente()
         if not left:
             return None
-        
-        while self.current_token and (
-            self.current_token.token_type == TokenType.ARITHMETIC_OPERATOR.value and self.current_token.value in ['+', '-', '++', '--'] or
-            self.current_token.token_type in [TokenType.INCREMENT_OP.value, TokenType.DECREMENT_OP.value]
-        ):
-            if self.current_token.token_type == TokenType.INCREMENT_OP.value:
-                op_token = self.consume(TokenType.INCREMENT_OP.value)
-                op_value = '++'
-            elif self.current_token.token_type == TokenType.DECREMENT_OP.value:
-                op_token = self.consume(TokenType.DECREMENT_OP.value)
-                op_value = '--'
-            else:
-                op_token = self.consume(TokenType.ARITHMETIC_OPERATOR.value)
-                op_value = op_token.value
-            
-            right = self.parse_termino()
-            if right:
-                left = ASTNode("expresion_simple", op_value, op_token.line, op_token.column, children=[left, right])
-            else:
-                self.error(f"Se esperaba un término después de '{op_value}'")
+
+        while True:
+            token = self.current_token
+            if token is None:
                 break
-        return left
-    
-    def parse_termino(self) -> Optional[ASTNode]:
-        """termino → factor ( ( * | / | % ) factor )*"""
-        left = self.parse_factor()
-        if not left:
-            return None
-        
-        while self.match(TokenType.ARITHMETIC_OPERATOR.value) and self.current_token.value in ['*', '/', '%']:
-            op_token = self.consume(TokenType.ARITHMETIC_OPERATOR.value)
-            right = self.parse_factor()
-            if right:
-                left = ASTNode("termino", op_token.value, op_token.line, op_token.column, children=[left, right])
-            else:
-                self.error(f"Se esperaba un factor después de '{op_token.value}'")
+            entry = _EXPR_OPS.get(token.value)
+            if entry is None or entry[0] < min_prec:
                 break
-        return left
-    
-    def parse_factor(self) -> Optional[ASTNode]:
-        """factor → componente ( ^ componente )*"""
-        left = self.parse_componente()
-        if not left:
-            return None
-        
-        while self.match(TokenType.ARITHMETIC_OPERATOR.value, '^'):
-            op_token = self.consume(TokenType.ARITHMETIC_OPERATOR.value, '^')
-            right = self.parse_componente()
+            prec, node_type, left_assoc = entry
+
+            self.advance()
+            right = self.parse_expresion(prec + 1 if left_assoc else prec)
             if right:
-                left = ASTNode("factor", op_token.value, op_token.line, op_token.column, children=[left, right])
+                left = ASTNode(node_type, token.value, token.line, token.column,
+                               children=[left, right])
             else:
-                self.error(f"Se esperaba un componente después de '^'")
+                self.error(f"Se esperaba {_EXPR_EXPECTED[prec]} después de '{token.value}'")
                 break
         return left
-    
+
     def parse_componente(self) -> Optional[ASTNode]:
         """componente → ( expresion ) | num_entero | num_flotante | id | bool_val | cadena | ! componente"""
-        try:
-            if self.match(TokenType.SYMBOL.value, '('):
-                open_token = self.current_token
-                self.advance()
-                expr = self.parse_expresion()
-                if not self.consume(TokenType.SYMBOL.value, ')'):
-                    self.error(f"Se esperaba ')' para cerrar el paréntesis abierto en línea {open_token.line}, columna {open_token.column}")
-                    self.synchronize(recover_token=';')
-                return expr
-            elif self.match(TokenType.INTEGER.value):
-                token = self.consume(TokenType.INTEGER.value)
-                return ASTNode("numero", token.value, token.line, token.column)
-            elif self.match(TokenType.REAL.value):
-                token = self.consume(TokenType.REAL.value)
-                return ASTNode("numero", token.value, token.line, token.column)
-            
-            # --- INICIO DE LA CORRECCIÓN ---
-            # 1. Comprobar 'true'/'false' (como KEYWORD) PRIMERO.
-            elif self.match(TokenType.RESERVED_WORD.value) and self.current_token.value in ['true', 'false']:
-                token = self.consume(TokenType.RESERVED_WORD.value)
-                return ASTNode("bool", token.value, token.line, token.column)
-            
-            # 2. Comprobar si es un IDENTIFIER
-            elif self.match(TokenType.IDENTIFIER.value):
-                token = self.current_token
-                
-                # 2a. Comprobar si es 'true' o 'false' (en caso de que el léxico falle y lo marque como ID)
-                if token.value in ['true', 'false']:
-                    self.advance() # Consumir el token
-                    return ASTNode("bool", token.value, token.line, token.column)
-                
-                # 2b. Si no, es un 'id' normal
-                else:
-                    token = self.consume(TokenType.IDENTIFIER.value) # Consume el ID
-                    return ASTNode("id", token.value, token.line, token.column)
-            # --- FIN DE LA CORRECCIÓN ---
-                
-            elif self.match(TokenType.STRING_LITERAL.value):
-                token = self.consume(TokenType.STRING_LITERAL.value)
-                return ASTNode("cadena", token.value, token.line, token.column)
-            elif self.match(TokenType.LOGICAL_OPERATOR.value, '!'):
-                op_token = self.consume(TokenType.LOGICAL_OPERATOR.value, '!')
-                comp = self.parse_componente()
-                if comp:
-                    nodo = ASTNode("expresion_logica", op_token.value, op_token.line, op_token.column, children=[comp])
-                    return nodo
-                else:
-                    self.error("Se esperaba un componente después de '!'")
+        # Token, tipo y valor en locales: este método se ejecuta una
+        # vez por operando y releía self.current_token en cada rama.
+        # Sin try/except envolvente: los errores de gramática ya se
+        # reportan explícitamente rama por rama (incluido el EOF), y un
+        # fallo real del parser debe propagarse, no convertirse en un
+        # nodo "error" silencioso.
+        token = self.current_token
+        if token is None:
+            self.error("Componente no válido: EOF")
+            return None
+        token_type = token.token_type
+        value = token.value
+
+        if token_type is _T_SYM and value == '(':
+            self.advance()
+            expr = self.parse_expresion()
+            if not self.consume(_T_SYM, ')'):
+                self.error(f"Se esperaba ')' para cerrar el paréntesis abierto en línea {token.line}, columna {token.column}")
+                self.synchronize(recover_token=';')
+            return expr
+        elif token_type is _T_INT or token_type is _T_REAL:
+            self.advance()
+            return ASTNode("numero", value, token.line, token.column)
+        # 'true'/'false' primero, ya sea como KEYWORD o como IDENTIFIER
+        # (por si el léxico los marca como ID).
+        elif token_type is _T_KW and value in _BOOL_LITERALS:
+            self.advance()
+            return ASTNode("bool", value, token.line, token.column)
+        elif token_type is _T_IDENT:
+            self.advance()
+            if value in _BOOL_LITERALS:
+                return ASTNode("bool", value, token.line, token.column)
+            return ASTNode("id", value, token.line, token.column)
+        elif token_type is _T_STRING:
+            self.advance()
+            return ASTNode("cadena", value, token.line, token.column)
+        elif token_type is _T_LOGIC and value == '!':
+            self.advance()
+            comp = self.parse_componente()
+            if comp:
+                return ASTNode("expresion_logica", value, token.line, token.column, children=[comp])
             else:
-                self.error(f"Componente no válido: {self.current_token.value if self.current_token else 'EOF'}")
+                self.error("Se esperaba un componente después de '!'")
                 return None
-        except Exception as e:
-            self.error(f"Error en componente: {str(e)}")
-            self.synchronize(recover_token=';')
-            return ASTNode("componente", value="error")
+        else:
+            self.error(f"Componente no válido: {value}")
+            return None
     
+    def ast_as_dict(self):
+        """Devuelve el AST como diccionario, recorriéndolo una sola vez:
+        display_results y la escritura de _ast.json comparten el resultado."""
+        if self._ast_dict is None:
+            self._ast_dict = self.ast.to_dict()
+        return self._ast_dict
+
     def display_results(self):
         """Display parsing results"""
         if self.ast:
             print("=== ABSTRACT SYNTAX TREE ===")
-            print(json.dumps(self.ast.to_dict(), indent=2, ensure_ascii=False))
+            if orjson is not None:
+                print(orjson.dumps(self.ast, default=_ast_default,
+                                   option=orjson.OPT_INDENT_2).decode())
+            else:
+                print(json.dumps(self.ast_as_dict(), indent=2, ensure_ascii=False))
             print()
         
         if self.errors:
-            error_table = PrettyTable()
-            error_table.field_names = ["Descripción", "Línea", "Columna"]
-            for error in self.errors:
-                error_table.add_row([error.description, error.line, error.column])
-            
+            # Tabla formateada a mano con la misma forma que producía
+            # PrettyTable: el IDE parte cada fila por '|' y espera
+            # exactamente tres columnas, saltando bordes y cabecera.
+            rows = [(error.description, str(error.line), str(error.column))
+                    for error in self.errors]
+            w0 = max(len("Descripción"), max(len(r[0]) for r in rows))
+            w1 = max(len("Línea"), max(len(r[1]) for r in rows))
+            w2 = max(len("Columna"), max(len(r[2]) for r in rows))
+            border = f"+-{'-' * w0}-+-{'-' * w1}-+-{'-' * w2}-+"
+
+            lines = [border,
+                     f"| {'Descripción':<{w0}} | {'Línea':<{w1}} | {'Columna':<{w2}} |",
+                     border]
+            lines.extend(f"| {d:<{w0}} | {l:>{w1}} | {c:>{w2}} |" for d, l, c in rows)
+            lines.append(border)
+
             print("=== ERRORES SINTÁCTICOS ===", file=sys.stderr)
-            print(error_table, file=sys.stderr)
+            print('\n'.join(lines), file=sys.stderr)
         else:
             print("Análisis sintáctico completado sin errores.")
 
@@ -772,8 +871,15 @@ def main():
         
         if ast:
             ast_file = file_path.replace('.txt', '_ast.json')
-            with open(ast_file, 'w', encoding='utf-8') as f:
-                json.dump(ast.to_dict(), f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(ast_file, 'wb') as f:
+                    f.write(orjson.dumps(ast, default=_ast_default,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                # Sin orjson: JSON compacto; el archivo lo consume el
+                # analizador semántico, el sangrado no aporta nada.
+                with open(ast_file, 'w', encoding='utf-8') as f:
+                    json.dump(analyzer.ast_as_dict(), f, ensure_ascii=False)
                 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)